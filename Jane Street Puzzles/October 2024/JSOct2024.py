@@ -7,12 +7,142 @@ Description: This script solves the Knight's Tour puzzle for the Jane Street Oct
              both scoring exactly 2024 points according to specific scoring rules.
 Version: 1.0
 Python Version: 3.x
-Dependencies: numpy, collections (deque), itertools (combinations, permutations)
+Dependencies: itertools (combinations, islice, permutations)
 """
 
-import numpy as np
-from collections import deque
-from itertools import combinations, permutations
+import hashlib
+import os
+import pickle
+import time
+from itertools import combinations, islice, permutations
+
+# Base directory for checkpoint and result cache files
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CHECKPOINT_PATH = os.path.join(BASE_DIR, "Data", "knight_search_checkpoint.pkl")
+RESULT_CACHE_PATH = os.path.join(BASE_DIR, "Data", "knight_search_results.pkl")
+CHECKPOINT_INTERVAL = 30  # seconds between checkpoint writes
+CHECKPOINT_CHECK_EVERY = 4096  # search steps between checks of the checkpoint timer
+
+
+class SearchCheckpoint:
+    """
+    Persists the progress of a knight search so an interrupted run can resume.
+    The state holds each path enumeration's DFS stack of move indices and the
+    length of its paths file, how many (A, B, C) triples are done and the best
+    solution so far. Found paths go to their own append-only file, so the state
+    stays small however many paths there are. Checkpoint and paths files are
+    named by a hash of the search spec, so different searches never share them.
+    Finished results are cached by search spec.
+    """
+
+    def __init__(self, checkpoint_path=CHECKPOINT_PATH, cache_path=RESULT_CACHE_PATH,
+                 interval=CHECKPOINT_INTERVAL):
+        self.checkpoint_path = checkpoint_path
+        self.cache_path = cache_path
+        self.interval = interval
+        self.state = None
+        self._last_save = time.monotonic()
+
+    @staticmethod
+    def _read(path, default):
+        if not os.path.exists(path):
+            return default
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # A damaged file just means starting over
+            return default
+
+    @staticmethod
+    def _write(path, data):
+        # Write to a temporary file first so an interruption never leaves a torn file
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def _spec_root(self, spec):
+        root, _ = os.path.splitext(self.checkpoint_path)
+        return f"{root}_{hashlib.sha1(repr(spec).encode()).hexdigest()[:12]}"
+
+    def state_path(self, spec):
+        """Checkpoint file for a search spec."""
+        return self._spec_root(spec) + ".pkl"
+
+    def paths_path(self, start, end):
+        """File holding the paths found from start to end for the loaded spec."""
+        return f"{self._spec_root(self.state['spec'])}_{start[0]}{start[1]}_{end[0]}{end[1]}.paths"
+
+    @staticmethod
+    def encode_path(path):
+        # One byte for the length, then one byte per square
+        return bytes([len(path)] + [x * 6 + y for x, y in path])
+
+    def open_paths(self, start, end, frontier):
+        """
+        Read the paths saved up to the frontier's offset and return them with the
+        file opened for appending, dropping anything written after the last
+        checkpoint. A file shorter than the offset restarts the frontier.
+        """
+        path = self.paths_path(start, end)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        f = open(path, 'a+b')
+        if f.seek(0, os.SEEK_END) < frontier["offset"]:
+            frontier.update(stack=[0], offset=0, done=False)
+        offset = frontier["offset"]
+        f.truncate(offset)
+        f.seek(0)
+        data = f.read(offset)
+        f.seek(offset)
+        paths = []
+        i = 0
+        while i < len(data):
+            length = data[i]
+            paths.append([divmod(square, 6) for square in data[i + 1:i + 1 + length]])
+            i += 1 + length
+        return paths, f
+
+    def cached_result(self, spec):
+        """Return (True, result) if a finished run for spec is cached, else (False, None)."""
+        cache = self._read(self.cache_path, {})
+        if spec in cache:
+            return True, cache[spec]
+        return False, None
+
+    def load(self, spec):
+        """Load the saved state for spec, or start a fresh one if none matches."""
+        state = self._read(self.state_path(spec), None)
+        if not state or state.get("spec") != spec:
+            state = {"spec": spec, "frontiers": {}, "triples_done": 0, "best": None}
+        self.state = state
+        self._last_save = time.monotonic()
+        return state
+
+    def due(self):
+        """Whether the checkpoint interval has elapsed since the last write."""
+        return time.monotonic() - self._last_save >= self.interval
+
+    def save(self, force=False):
+        """Write the current state if the interval has elapsed (or force is set)."""
+        now = time.monotonic()
+        if self.state is None or (not force and now - self._last_save < self.interval):
+            return
+        self._write(self.state_path(self.state["spec"]), self.state)
+        self._last_save = now
+
+    def finish(self, result):
+        """Record the final result in the cache and drop the checkpoint."""
+        cache = self._read(self.cache_path, {})
+        cache[self.state["spec"]] = result
+        self._write(self.cache_path, cache)
+        stale = [self.state_path(self.state["spec"])]
+        stale += [self.paths_path(start, end) for start, end in self.state["frontiers"]]
+        for path in stale:
+            if os.path.exists(path):
+                os.remove(path)
+        self.state = None
 
 
 class KnightPuzzleSolver:
@@ -32,29 +162,70 @@ class KnightPuzzleSolver:
             (1, 2), (1, -2), (-1, 2), (-1, -2)
         ]
 
-    def generate_paths(self, start, end, max_depth=15):
+    def generate_paths(self, start, end, max_depth=15, checkpoint=None):
         """
         Generate all possible knight's paths from start to end within max_depth moves.
-        Uses breadth-first search to explore paths.
+        Uses depth-first search over move indices and returns the paths shortest first.
+        If a checkpoint is given, the move index stack is saved periodically and
+        enumeration resumes from it.
         """
+        # stack[i] is the next move to try from path[i]
+        stack = [0]
         paths = []
-        queue = deque([(start, [start])])
-
-        while queue:
-            current_pos, path = queue.popleft()
-            if current_pos == end:
-                paths.append(path)
-                continue
-            if len(path) >= max_depth:
-                continue
-            for move in self.knight_moves:
-                new_x = current_pos[0] + move[0]
-                new_y = current_pos[1] + move[1]
+        paths_file = None
+        if checkpoint is not None:
+            frontier = checkpoint.state["frontiers"].setdefault(
+                (start, end), {"stack": [0], "offset": 0, "done": False})
+            paths, paths_file = checkpoint.open_paths(start, end, frontier)
+            if frontier["done"]:
+                paths_file.close()
+                return sorted(paths, key=len)
+            stack = list(frontier["stack"])
+
+        # Rebuild the current path from the moves already taken
+        path = [start]
+        for index in stack[:-1]:
+            move = self.knight_moves[index - 1]
+            path.append((path[-1][0] + move[0], path[-1][1] + move[1]))
+
+        try:
+            steps = 0
+            while stack:
+                if stack[-1] == len(self.knight_moves):
+                    stack.pop()
+                    path.pop()
+                    continue
+                move = self.knight_moves[stack[-1]]
+                stack[-1] += 1
+                new_x = path[-1][0] + move[0]
+                new_y = path[-1][1] + move[1]
                 new_pos = (new_x, new_y)
                 if 0 <= new_x < 6 and 0 <= new_y < 6 and new_pos not in path:
-                    queue.append((new_pos, path + [new_pos]))
+                    if new_pos == end:
+                        paths.append(path + [new_pos])
+                        if paths_file is not None:
+                            paths_file.write(checkpoint.encode_path(paths[-1]))
+                    elif len(path) + 1 < max_depth:
+                        path.append(new_pos)
+                        stack.append(0)
 
-        return paths
+                steps += 1
+                if paths_file is not None and steps % CHECKPOINT_CHECK_EVERY == 0 and checkpoint.due():
+                    paths_file.flush()
+                    frontier["stack"] = list(stack)
+                    frontier["offset"] = paths_file.tell()
+                    checkpoint.save(force=True)
+
+            if paths_file is not None:
+                paths_file.flush()
+                frontier.update(stack=None, offset=paths_file.tell(), done=True)
+                checkpoint.save(force=True)
+        finally:
+            if paths_file is not None:
+                paths_file.close()
+
+        # Same order as a breadth-first search: by length, then by moves taken
+        return sorted(paths, key=len)
 
     def calculate_score(self, path, values):
         """
@@ -73,32 +244,70 @@ class KnightPuzzleSolver:
                 score += value_curr  # Add if moving within
         return score
 
-    def solve_puzzle(self):
+    def search_triple(self, nums, paths_a1_f6, paths_a6_f1, target=2024):
+        """
+        Try every assignment of nums to A, B and C and return the first
+        (A, B, C, path1, path2) where both disjoint paths score target, else None.
+        """
+        # Consider all permutations (assignments of A, B, C)
+        for perm in permutations(nums):
+            values = {'A': perm[0], 'B': perm[1], 'C': perm[2]}
+            for path1 in paths_a1_f6:
+                score1 = self.calculate_score(path1, values)
+                if score1 != target:
+                    continue
+                for path2 in paths_a6_f1:
+                    if set(path1).isdisjoint(set(path2)):
+                        score2 = self.calculate_score(path2, values)
+                        if score2 == target:
+                            A, B, C = values['A'], values['B'], values['C']
+                            return A, B, C, path1, path2
+        return None
+
+    def solve_puzzle(self, max_value=50, max_depth=15, target=2024, exhaustive=False,
+                     checkpoint=None):
+        """
+        Search for A, B, C and two disjoint paths that both score target.
+        By default the first solution found is returned; with exhaustive=True every
+        triple is checked and the solution with the lowest A + B + C is returned.
+        With a SearchCheckpoint, progress is saved periodically and resumed on the
+        next call, and finished runs are answered from the result cache.
+        """
+        spec = (tuple(map(tuple, self.board)), max_value, max_depth, target, exhaustive)
+        if checkpoint is not None:
+            found, result = checkpoint.cached_result(spec)
+            if found:
+                return result
+            state = checkpoint.load(spec)
+            triples_done, best = state["triples_done"], state["best"]
+        else:
+            triples_done, best = 0, None
+
         # From a1 (0, 0) to f6 (5, 5)
-        paths_a1_f6 = self.generate_paths((0, 0), (5, 5))
+        paths_a1_f6 = self.generate_paths((0, 0), (5, 5), max_depth, checkpoint)
 
         # From a6 (0, 5) to f1 (5, 0)
-        paths_a6_f1 = self.generate_paths((0, 5), (5, 0))
-
-        valid_integers = range(1, 50)
-        # Generate all combinations of 3 distinct integers whose sum is less than 50
-        for nums in combinations(valid_integers, 3):
-            if sum(nums) >= 50:
-                continue
-            # Consider all permutations (assignments of A, B, C)
-            for perm in permutations(nums):
-                values = {'A': perm[0], 'B': perm[1], 'C': perm[2]}
-                for path1 in paths_a1_f6:
-                    score1 = self.calculate_score(path1, values)
-                    if score1 != 2024:
-                        continue
-                    for path2 in paths_a6_f1:
-                        if set(path1).isdisjoint(set(path2)):
-                            score2 = self.calculate_score(path2, values)
-                            if score2 == 2024:
-                                A, B, C = values['A'], values['B'], values['C']
-                                return A, B, C, path1, path2
-        return None
+        paths_a6_f1 = self.generate_paths((0, 5), (5, 0), max_depth, checkpoint)
+
+        valid_integers = range(1, max_value)
+        # Generate all combinations of 3 distinct integers whose sum is less than max_value,
+        # skipping the ones a resumed run has already been through
+        for nums in islice(combinations(valid_integers, 3), triples_done, None):
+            # A triple that can't beat the best sum so far needs no search
+            if sum(nums) < max_value and (best is None or sum(nums) < sum(best[:3])):
+                result = self.search_triple(nums, paths_a1_f6, paths_a6_f1, target)
+                if result is not None:
+                    best = result
+            triples_done += 1
+            if checkpoint is not None:
+                state.update(triples_done=triples_done, best=best)
+                checkpoint.save()
+            if best is not None and not exhaustive:
+                break
+
+        if checkpoint is not None:
+            checkpoint.finish(best)
+        return best
 
     @staticmethod
     def format_path(path):
@@ -230,9 +439,10 @@ class KnightPuzzleSolver:
         print("|{:^{width}}|{:^{width}}|".format(f"Final Score: {score1}", f"Final Score: {score2}", width=column_width))
         print(separator)
 
-def main():
+TEST_SOLUTION = "1,3,2,a1,c2,a3,c4,d6,b5,d4,f3,e5,c6,a5,b3,d2,e4,f6,a6,c5,d3,b4,a2,c3,e2,f4,d5,b6,a4,b2,d1,e3,f1"
+
+def main(test_solution=TEST_SOLUTION, max_depth=15, exhaustive=False):
     solver = KnightPuzzleSolver()
-    test_solution = "1,3,2,a1,c2,a3,c4,d6,b5,d4,f3,e5,c6,a5,b3,d2,e4,f6,a6,c5,d3,b4,a2,c3,e2,f4,d5,b6,a4,b2,d1,e3,f1"
     
     if test_solution:
         # Parse the test solution
@@ -260,7 +470,8 @@ def main():
         solver.visualize_solution(A, B, C, path1, path2)
         solver.print_detailed_scoring(path1, path2, {'A': A, 'B': B, 'C': C})
     else:
-        result = solver.solve_puzzle()
+        result = solver.solve_puzzle(max_depth=max_depth, exhaustive=exhaustive,
+                                     checkpoint=SearchCheckpoint())
         if result:
             A, B, C, path1, path2 = result
             formatted_path1 = solver.format_path(path1)
@@ -0,0 +1,112 @@
+"""
+File: test_checkpoint.py
+Description: Regression checks for resuming interrupted knight searches with SearchCheckpoint.
+             Runs under pytest or directly with `python test_checkpoint.py`.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from JSOct2024 import KnightPuzzleSolver, SearchCheckpoint
+
+# Small enough to run in a few seconds
+MAX_VALUE = 20
+MAX_DEPTH = 9
+
+
+class InterruptingCheckpoint(SearchCheckpoint):
+    """Raises KeyboardInterrupt on the given write, before or after it reaches disk."""
+
+    def __init__(self, directory, stop_at, before_write=False):
+        super().__init__(os.path.join(directory, "checkpoint.pkl"),
+                         os.path.join(directory, "results.pkl"), interval=0)
+        self.stop_at = stop_at
+        self.before_write = before_write
+        self.writes = 0
+
+    def save(self, force=False):
+        self.writes += 1
+        if self.before_write and self.writes == self.stop_at:
+            raise KeyboardInterrupt
+        super().save(force)
+        if self.writes == self.stop_at:
+            raise KeyboardInterrupt
+
+
+def make_checkpoint(directory):
+    return SearchCheckpoint(os.path.join(directory, "checkpoint.pkl"),
+                            os.path.join(directory, "results.pkl"), interval=0)
+
+
+def interrupted(solver, checkpoint, **spec):
+    try:
+        solver.solve_puzzle(checkpoint=checkpoint, **spec)
+    except KeyboardInterrupt:
+        return True
+    return False
+
+
+def test_resume_matches_uncheckpointed_run():
+    solver = KnightPuzzleSolver()
+    expected = solver.solve_puzzle(MAX_VALUE, MAX_DEPTH, exhaustive=True)
+    with tempfile.TemporaryDirectory() as directory:
+        # Stop once in each path enumeration and once in the triple loop
+        for stop_at in (1, 3, 10):
+            checkpoint = InterruptingCheckpoint(directory, stop_at)
+            assert interrupted(solver, checkpoint, max_value=MAX_VALUE, max_depth=MAX_DEPTH,
+                               exhaustive=True)
+        result = solver.solve_puzzle(MAX_VALUE, MAX_DEPTH, exhaustive=True,
+                                     checkpoint=make_checkpoint(directory))
+        assert result == expected
+        # Only the result cache is left behind
+        assert os.listdir(directory) == ["results.pkl"]
+
+
+def test_cached_result_skips_search():
+    solver = KnightPuzzleSolver()
+    with tempfile.TemporaryDirectory() as directory:
+        expected = solver.solve_puzzle(MAX_VALUE, MAX_DEPTH, checkpoint=make_checkpoint(directory))
+        solver.generate_paths = None  # any search would now fail
+        assert solver.solve_puzzle(MAX_VALUE, MAX_DEPTH, checkpoint=make_checkpoint(directory)) == expected
+
+
+def test_other_spec_does_not_corrupt_interrupted_run():
+    solver = KnightPuzzleSolver()
+    expected = solver.solve_puzzle(MAX_VALUE, MAX_DEPTH, exhaustive=True)
+    with tempfile.TemporaryDirectory() as directory:
+        # Run X stops in its triple loop, after both enumerations are saved
+        checkpoint = InterruptingCheckpoint(directory, 10)
+        assert interrupted(solver, checkpoint, max_value=MAX_VALUE, max_depth=MAX_DEPTH,
+                           exhaustive=True)
+        # Run Y with another spec stops before its first write
+        checkpoint = InterruptingCheckpoint(directory, 1, before_write=True)
+        assert interrupted(solver, checkpoint, max_value=MAX_VALUE, max_depth=MAX_DEPTH)
+        result = solver.solve_puzzle(MAX_VALUE, MAX_DEPTH, exhaustive=True,
+                                     checkpoint=make_checkpoint(directory))
+        assert result == expected
+
+
+def test_short_paths_file_restarts_frontier():
+    solver = KnightPuzzleSolver()
+    expected = solver.solve_puzzle(MAX_VALUE, MAX_DEPTH, exhaustive=True)
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoint = InterruptingCheckpoint(directory, 10)
+        assert interrupted(solver, checkpoint, max_value=MAX_VALUE, max_depth=MAX_DEPTH,
+                           exhaustive=True)
+        for name in os.listdir(directory):
+            if name.endswith(".paths"):
+                with open(os.path.join(directory, name), 'r+b') as f:
+                    f.truncate(5)
+        result = solver.solve_puzzle(MAX_VALUE, MAX_DEPTH, exhaustive=True,
+                                     checkpoint=make_checkpoint(directory))
+        assert result == expected
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
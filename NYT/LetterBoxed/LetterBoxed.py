@@ -6,10 +6,10 @@ import pickle
 import sys
 from config import *
 
-def load_lb_data():
-    file_path = get_daily_data_path(TODAY)
+def load_lb_data(date=TODAY):
+    file_path = get_daily_data_path(date)
     if not os.path.exists(file_path):
-        print(f"Error: Daily data for {TODAY} is not available at {file_path}", file=sys.stderr)
+        print(f"Error: Daily data for {date} is not available at {file_path}", file=sys.stderr)
         sys.exit(1)
     
     with open(file_path, 'r') as f:
@@ -62,8 +62,8 @@ def find_shortest_path(words, all_letters):
 
     return shortest_solution
 
-def main():
-    lb_data = load_lb_data()
+def main(date=TODAY):
+    lb_data = load_lb_data(date)
     all_letters = set().union(*lb_data.values())
 
     print("Loading dictionary...")
@@ -1,4 +1,3 @@
-import requests
 from collections import Counter
 
 
@@ -12,6 +11,8 @@ WORD_LIST_URL = "https://raw.githubusercontent.com/dwyl/english-words/master/wor
 
 def download_word_list(url):
     """Download the word list from the given URL."""
+    import requests
+
     response = requests.get(url)
     if response.status_code == 200:
         return set(word.strip().lower() for word in response.text.split())
@@ -51,13 +52,13 @@ def find_valid_words(mandatory_char, optional_chars, word_list):
         key=len, reverse=True
     )
 
-def main():
+def main(mandatory_char=MANDATORY_CHAR, optional_chars=OPTIONAL_CHARS):
     try:
         # Download the word list
         word_list = download_word_list(WORD_LIST_URL)
 
         # Find all valid words
-        valid_words = find_valid_words(MANDATORY_CHAR, OPTIONAL_CHARS, word_list)
+        valid_words = find_valid_words(mandatory_char, optional_chars, word_list)
         
         # Filter words to match NYT criteria
         nyt_words = filter_nyt_words(valid_words)
@@ -1,13 +1,25 @@
-import requests
-import spacy
 import pickle
 import os
+import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from config import *
 
+nlp = None
+
+def load_nlp():
+    # Load spaCy model once, on first use
+    global nlp
+    if nlp is None:
+        import spacy
+
+        print("Loading spaCy model...")
+        nlp = spacy.load("en_core_web_sm")
+    return nlp
 
 def download_raw_dictionary():
     # Download raw dictionary from GitHub
+    import requests
+
     print("Downloading raw dictionary...")
     with requests.get(RAW_DICT_URL, stream=True) as response:
         response.raise_for_status()
@@ -19,7 +31,7 @@ def download_raw_dictionary():
 
 def is_common_word(word):
     # Check if word is in spaCy's vocabulary
-    return word.lower() in nlp.vocab.strings
+    return word.lower() in load_nlp().vocab.strings
 
 def process_word(word, min_length, max_length):
     # Process a single word based on length and commonness
@@ -38,6 +50,7 @@ def process_dictionary(game_type):
     
     DATA_DIR = config["data_dir"]
     
+    load_nlp()
     processed_words = set()
     with ThreadPoolExecutor() as executor:
         futures = [executor.submit(process_word, word, min_length, max_length) for word in raw_words]
@@ -54,10 +67,15 @@ def process_dictionary(game_type):
     print(f"Processed dictionary for {game_type} saved to {filename}")
     print(f"Total words processed: {len(processed_words)}")
 
-if __name__ == "__main__":
-    # Load spaCy model
-    print("Loading spaCy model...")
-    nlp = spacy.load("en_core_web_sm")
+def main(game_types=tuple(GAME_CONFIGS)):
+    # Check every game type before downloading anything
+    unknown = [game_type for game_type in game_types if game_type not in GAME_CONFIGS]
+    if unknown:
+        print(f"Error: Unknown game type(s): {', '.join(unknown)}. Choose from {', '.join(GAME_CONFIGS)}.", file=sys.stderr)
+        sys.exit(1)
+
+    for game_type in game_types:
+        process_dictionary(game_type)
 
-    process_dictionary("LetterBoxed")
-    process_dictionary("spelling_bee")
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,8 @@
+import os
+
+# Base directory for the NYT projects
+NYT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # Constants
 RAW_DICT_URL = "https://raw.githubusercontent.com/dwyl/english-words/master/words_alpha.txt"
 CHUNK_SIZE = 1024 * 1024  # 1MB chunks
@@ -8,12 +13,12 @@ GAME_CONFIGS = {
         "min_length": 3,
         "max_length": 15,
         "filename": "ProcessedDictionaryLetterBoxed.pkl",
-        "data_dir": "LetterBoxed/Data"
+        "data_dir": os.path.join(NYT_DIR, "LetterBoxed", "Data")
     },
     "spelling_bee": {
         "min_length": 4,
         "max_length": 20,
         "filename": "ProcessedDictionarySpellingBee.pkl",
-        "data_dir": "SpellingBee/Data"
+        "data_dir": os.path.join(NYT_DIR, "SpellingBee", "Data")
     }
 }
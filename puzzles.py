@@ -0,0 +1,121 @@
+"""
+File: puzzles.py
+Description: Single entry point for the puzzle solvers in this repository.
+             Each subcommand loads its script only when it runs, so heavy
+             dependencies (requests, spaCy) are imported by the commands that
+             need them instead of on every start.
+Usage: python puzzles.py {letterboxed,spellingbee,build-dict,knights} [options]
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import argparse
+import importlib.util
+import os
+import sys
+
+# Base directory for the repository
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SCRIPTS = {
+    "letterboxed": os.path.join(BASE_DIR, "NYT", "LetterBoxed", "LetterBoxed.py"),
+    "spellingbee": os.path.join(BASE_DIR, "NYT", "SpellingBee", "Spelling Bee.py"),
+    "build-dict": os.path.join(BASE_DIR, "NYT", "WordData", "ProcessWords.py"),
+    "knights": os.path.join(BASE_DIR, "Jane Street Puzzles", "October 2024", "JSOct2024.py"),
+}
+
+
+def load_script(command):
+    """
+    Import the script behind a subcommand from its file path.
+    The script's directory goes first on sys.path so its own config module is
+    found regardless of the working directory.
+    """
+    path = SCRIPTS[command]
+    script_dir = os.path.dirname(path)
+    sys.path.insert(0, script_dir)
+    # LetterBoxed and WordData both ship a module named config
+    sys.modules.pop("config", None)
+    spec = importlib.util.spec_from_file_location(command.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="puzzles", description="Puzzle solvers")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    letterboxed = subparsers.add_parser("letterboxed", help="Solve the NYT Letter Boxed puzzle")
+    letterboxed.add_argument("--date", help="Puzzle date as DDMMYYYY (default: today)")
+
+    spellingbee = subparsers.add_parser("spellingbee", help="Find NYT Spelling Bee words")
+    spellingbee.add_argument("--mandatory", help="Centre letter every word must contain")
+    spellingbee.add_argument("--optional", help="The six outer letters")
+    spellingbee.set_defaults(subparser=spellingbee)
+
+    build_dict = subparsers.add_parser("build-dict", help="Build the processed word dictionaries")
+    # Checked by ProcessWords.main, as argparse rejects an empty list against choices
+    build_dict.add_argument("games", nargs="*",
+                            help="Game types to build: LetterBoxed, spelling_bee (default: all)")
+
+    knights = subparsers.add_parser("knights", help="Jane Street October 2024 knight puzzle")
+    knights.add_argument("--solve", action="store_true",
+                         help="Search for a solution instead of validating the known one")
+    knights.add_argument("--max-depth", type=int, help="Longest path to enumerate (requires --solve)")
+    knights.add_argument("--exhaustive", action="store_true",
+                         help="Check every triple and keep the lowest A + B + C (requires --solve)")
+    knights.set_defaults(subparser=knights)
+
+    return parser
+
+
+def validate(args):
+    """Check options argparse can't, reporting errors with the subcommand's usage."""
+    if args.command == "spellingbee":
+        if args.mandatory is not None and not (len(args.mandatory) == 1 and args.mandatory.isalpha()):
+            args.subparser.error("--mandatory must be a single letter")
+        if args.optional is not None and not (len(args.optional) == 6 and args.optional.isalpha()):
+            args.subparser.error("--optional must be six letters")
+        if args.mandatory is not None and args.optional is not None and \
+                len(set((args.mandatory + args.optional).lower())) != 7:
+            args.subparser.error("--mandatory and --optional must be seven different letters")
+    elif args.command == "knights":
+        if not args.solve and (args.max_depth is not None or args.exhaustive):
+            args.subparser.error("--max-depth and --exhaustive require --solve")
+
+
+def run(args, module):
+    if args.command == "letterboxed":
+        module.main(args.date or module.TODAY)
+    elif args.command == "spellingbee":
+        # The word list is lowercase
+        mandatory = (module.MANDATORY_CHAR if args.mandatory is None else args.mandatory).lower()
+        optional = (module.OPTIONAL_CHARS if args.optional is None else args.optional).lower()
+        module.main(mandatory, optional)
+    elif args.command == "build-dict":
+        module.main(args.games or tuple(module.GAME_CONFIGS))
+    elif args.command == "knights":
+        if not args.solve:
+            module.main(module.TEST_SOLUTION)
+        elif args.max_depth is None:
+            module.main(None, exhaustive=args.exhaustive)
+        else:
+            module.main(None, args.max_depth, args.exhaustive)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    validate(args)
+    startup = time.perf_counter() - _START
+    module = load_script(args.command)
+    load_time = time.perf_counter() - _START - startup
+    print(f"puzzles: startup {startup * 1000:.1f} ms, {args.command} import {load_time * 1000:.1f} ms",
+          file=sys.stderr)
+    run(args, module)
+
+
+if __name__ == "__main__":
+    main()